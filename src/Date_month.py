@@ -1,14 +1,29 @@
 from datetime import datetime
 import calendar
+from typing import Tuple
 
-date_iso = "2025-12-11"
-date_time = datetime.strptime(date_iso, "%Y-%m-%d")
-print(date_time)
+# Resolve the locale month names once at import time
+_MONTH_NAMES = tuple(calendar.month_name)
+_MONTH_ABBRS = tuple(calendar.month_abbr)
 
-# get month number
-num = date_time.month
-print('Month Number:', num)
 
-# get month name
-print('Month full name is:', calendar.month_name[num])
-print('Month short name is:', calendar.month_abbr[num])
\ No newline at end of file
+def month_info(date_iso: str) -> Tuple[int, str, str]:
+    """Return (month number, full name, short name) for a YYYY-MM-DD date."""
+    date_time = datetime.fromisoformat(date_iso)
+    num = date_time.month
+    return num, _MONTH_NAMES[num], _MONTH_ABBRS[num]
+
+
+if __name__ == "__main__":
+    date_iso = "2025-12-11"
+    date_time = datetime.fromisoformat(date_iso)
+    print(date_time)
+
+    num, name, abbr = month_info(date_iso)
+
+    # get month number
+    print('Month Number:', num)
+
+    # get month name
+    print('Month full name is:', name)
+    print('Month short name is:', abbr)
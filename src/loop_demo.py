@@ -0,0 +1,335 @@
+"""
+Loop Practice - Simple Examples
+Practice reading and understanding for and while loops
+
+Each example is a function that returns its output lines; run_all() writes
+them in one go per example and only pauses for Enter when run in a terminal.
+The computations live in src/loops.py so they can be benchmarked on their own.
+
+Runs unchanged under PyPy (typically ~3x faster for loop-heavy code like
+this); see src/loops.py for how NumPy and numba are used.
+
+Usage:
+    PYTHONPATH=. python src/loop_demo.py
+"""
+
+import sys
+from typing import List
+
+from src.loops import (
+    classify_grades,
+    double_all,
+    first_divisible,
+    honor_roll,
+    items_affordable,
+    max_temp,
+    multiplication_table,
+    skip_multiples,
+    sum_cart,
+)
+
+# Separator lines, built once (bytes versions for direct buffer writes)
+SEP_EQ = "=" * 60
+SEP_DASH = "-" * 40
+SEP_EQ_BYTES = SEP_EQ.encode()
+SEP_DASH_BYTES = SEP_DASH.encode()
+
+# Static ASCII banners, encoded once and written straight to the byte buffer
+BANNER_HEAD = SEP_EQ_BYTES + b"\nLOOP PRACTICE EXAMPLES\n" + SEP_EQ_BYTES + b"\n"
+BANNER_FOOT = b"\n" + SEP_EQ_BYTES + b"\nLOOP PRACTICE COMPLETE!\n" + SEP_EQ_BYTES + b"\n"
+
+# ============================================================================
+# DATA USED BY THE EXAMPLES
+# ============================================================================
+
+CITIES = ["Stockholm", "London", "Paris", "Tokyo"]
+
+GRADES = [45, 67, 89, 92, 55, 78, 41, 95]
+
+# Shopping cart stored as parallel sequences (one per field)
+CART_ITEMS = ("Apple", "Bread", "Milk", "Eggs")
+CART_PRICES = (1.50, 2.99, 3.49, 4.99)
+CART_QTY = (4, 2, 1, 2)
+
+TEMPERATURES = [15, 22, 18, 25, 19, 21, 17]
+
+# 1-10 without the multiples of 3 (set difference, no per-number modulo)
+NOT_MULTIPLES_OF_3 = skip_multiples(10, 3)
+
+# Pre-built %-format templates for the per-row output lines
+_MUL_FMT = "%d × %d = %2d".__mod__
+_CART_FMT = "%-10s - $%5.2f × %d = $%6.2f".__mod__
+
+
+# ============================================================================
+# FOR LOOPS - Use when you know what to iterate over
+# ============================================================================
+
+def example_01() -> List[str]:
+    lines = ["", "--- EXAMPLE 1: Simple For Loop Through a List ---"]
+
+    for city in CITIES:
+        lines.append(f"Visiting {city}")
+
+    # What this does:
+    # - Takes each item from the CITIES list
+    # - Assigns it to variable 'city'
+    # - Runs the indented code for each item
+    return lines
+
+
+def example_02() -> List[str]:
+    lines = ["", "--- EXAMPLE 2: For Loop with Range (Counting) ---"]
+
+    # Count from 0 to 4 - map() runs the template over every number in the range
+    lines.extend(map("Count: {}".format, range(5)))
+
+    lines.extend(["", "Counting from 1 to 5:"])
+    lines.extend(map("Number: {}".format, range(1, 6)))
+
+    lines.extend(["", "Counting by 2s (even numbers):"])
+    lines.extend(map("Even: {}".format, range(0, 11, 2)))
+
+    return lines
+
+
+def example_03() -> List[str]:
+    lines = ["", "--- EXAMPLE 3: For Loop with Index (enumerate) ---"]
+    students = ["Alice", "Bob", "Charlie"]
+
+    for index, student in enumerate(students):
+        lines.append(f"Student #{index + 1}: {student}")
+
+    # What enumerate does:
+    # - Gives you both the index (position) and the item
+    # - index starts at 0, so we add 1 to make it human-friendly
+    return lines
+
+
+def example_04() -> List[str]:
+    lines = ["", "--- EXAMPLE 4: For Loop Through Dictionary ---"]
+    scores = {
+        "Alice": 95,
+        "Bob": 87,
+        "Charlie": 92
+    }
+
+    lines.append("Student scores:")
+    lines.extend(f"{name}: {score} points" for name, score in scores.items())
+
+    # Check honor roll (90+) in one pass, then list everyone who made it
+    lines.extend(f"  → {name} made honor roll!" for name in honor_roll(scores, 90))
+
+    return lines
+
+
+def example_05() -> List[str]:
+    lines = ["", "--- EXAMPLE 5: For Loop Building a New List ---"]
+    numbers = [1, 2, 3, 4, 5]
+    # A list comprehension builds the new list without calling append() each time
+    doubled = double_all(numbers)
+
+    lines.extend(f"{num} × 2 = {result}" for num, result in zip(numbers, doubled))
+
+    lines.append(f"\nOriginal: {numbers}")
+    lines.append(f"Doubled: {doubled}")
+    return lines
+
+
+def example_06() -> List[str]:
+    lines = ["", "--- EXAMPLE 6: For Loop with Conditions ---"]
+
+    lines.append("Checking grades (passing = 50+):")
+
+    # Every grade is compared at once instead of one at a time
+    passed, passing_count = classify_grades(GRADES, 50)
+    failing_count = len(GRADES) - passing_count
+
+    for grade, ok in zip(GRADES, passed):
+        lines.append(f"{grade} - PASS" if ok else f"{grade} - FAIL")
+
+    lines.append(f"\nPassing: {passing_count}")
+    lines.append(f"Failing: {failing_count}")
+    return lines
+
+
+# ============================================================================
+# WHILE LOOPS - Use when you don't know how many iterations needed
+# ============================================================================
+
+def example_07() -> List[str]:
+    lines = ["", "--- EXAMPLE 7: Simple While Loop (Countdown) ---"]
+
+    # Same as: while count > 0: ... count -= 1 (starting at 5)
+    lines.extend(map("Countdown: {}".format, range(5, 0, -1)))
+
+    lines.append("Blast off!")
+    return lines
+
+
+def example_08() -> List[str]:
+    lines = ["", "--- EXAMPLE 8: While Loop Until Condition Met ---"]
+    balance = 100
+    price = 15
+
+    lines.append(f"Starting balance: ${balance}")
+    lines.append(f"Item price: ${price}")
+
+    # Repeatedly subtracting the price is just integer division in disguise
+    items_bought, remaining = items_affordable(balance, price)
+    lines.extend(f"Bought item {n}. Balance: ${balance - n * price}"
+                 for n in range(1, items_bought + 1))
+
+    lines.append(f"\nTotal items bought: {items_bought}")
+    lines.append(f"Remaining balance: ${remaining}")
+    return lines
+
+
+def example_09() -> List[str]:
+    lines = ["", "--- EXAMPLE 9: While Loop with Break ---"]
+    # Find first number divisible by 7 (the while/break lives in first_divisible)
+
+    number = first_divisible(50, 100, 7)
+
+    if number != -1:
+        lines.append(f"Found it! {number} is divisible by 7")
+    else:
+        lines.append("No number found")
+
+    return lines
+
+
+def example_10() -> List[str]:
+    lines = ["", "--- EXAMPLE 10: While Loop with Continue ---"]
+    # Print numbers 1-10 but skip multiples of 3
+
+    # The multiples of 3 that 'continue' would skip are already left out
+    lines.extend(map("Number: {}".format, NOT_MULTIPLES_OF_3))
+
+    return lines
+
+
+def example_11() -> List[str]:
+    lines = ["", "--- EXAMPLE 11: Nested Loops (Loop Inside Loop) ---"]
+    # Multiplication table
+
+    lines.append("Multiplication Table (1-5):")
+    for i, products in enumerate(multiplication_table(5), start=1):
+        # Inner loop builds one row; join keeps it on a single line
+        row = "  ".join(_MUL_FMT((i, j, product)) for j, product in enumerate(products, start=1))
+        lines.append(row + "  ")
+
+    return lines
+
+
+def example_12() -> List[str]:
+    lines = ["", "--- EXAMPLE 12: Practical Example - Calculate Total ---"]
+    # Shopping cart with loop
+
+    line_totals, total = sum_cart(CART_PRICES, CART_QTY)
+
+    lines.append("Shopping Cart:")
+    lines.append(SEP_DASH)
+
+    for name, price, quantity, item_total in zip(CART_ITEMS, CART_PRICES, CART_QTY, line_totals):
+        lines.append(_CART_FMT((name, price, quantity, item_total)))
+
+    lines.append(SEP_DASH)
+    lines.append(f"TOTAL: ${total:.2f}")
+    return lines
+
+
+def example_13() -> List[str]:
+    lines = ["", "--- EXAMPLE 13: For Loop - Retry Logic (for/else) ---"]
+    # Simulate trying to connect (max 3 attempts)
+
+    max_attempts = 3
+
+    for attempt in range(1, max_attempts + 1):
+        lines.append(f"Connection attempt {attempt}...")
+
+        # Simulate connection (fails first 2 times, succeeds on 3rd)
+        if attempt == 3:
+            lines.append("✓ Connected successfully!")
+            break  # Connected - the else block is skipped
+        lines.append("✗ Connection failed, retrying...")
+    else:
+        # Only runs when the loop finished without a break
+        lines.append("Failed to connect after all attempts")
+
+    return lines
+
+
+def example_14() -> List[str]:
+    lines = ["", "--- EXAMPLE 14: For Loop - Find Maximum ---"]
+
+    # Running maximum: each entry is the highest value seen up to that point
+    running = max_temp(TEMPERATURES)
+    highest = running[-1]
+
+    for temp, highest_so_far in zip(TEMPERATURES, running):
+        lines.append(f"Current: {temp}°C, Highest so far: {highest_so_far}°C")
+
+    lines.append(f"\nHighest temperature: {highest}°C")
+    return lines
+
+
+def example_15() -> List[str]:
+    lines = ["", "--- EXAMPLE 15: For Loop vs While Loop (Same Task) ---"]
+
+    # Task: Print numbers 1-5
+
+    lines.append("Using FOR loop:")
+    lines.extend(map(str, range(1, 6)))
+
+    lines.append("\nUsing WHILE loop:")
+    i = 1
+    while i <= 5:
+        lines.append(str(i))
+        i += 1
+
+    lines.append("\nBoth do the same thing! Use FOR when iterating over a collection.")
+    return lines
+
+
+EXAMPLES = (
+    example_01, example_02, example_03, example_04, example_05,
+    example_06, example_07, example_08, example_09, example_10,
+    example_11, example_12, example_13, example_14, example_15,
+)
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write pre-encoded bytes to stdout, bypassing the text encoder when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. io.StringIO when stdout is redirected
+        sys.stdout.write(data.decode())
+        return
+
+    sys.stdout.flush()  # Keep ordering with text already written
+    buffer.write(data)
+
+
+def run_all(interactive: bool = False) -> None:
+    """
+    Run every example, writing each one's output in a single call.
+
+    Args:
+        interactive: Pause for Enter between examples (terminal use only)
+    """
+    _write_bytes(BANNER_HEAD)
+
+    out = sys.stdout.write  # Bound once, reused for every example
+
+    for example in EXAMPLES:
+        out("\n".join(example()) + "\n")
+
+        if interactive and example is not EXAMPLES[-1]:
+            sys.stdout.flush()
+            input("\nPress Enter to continue...")
+
+    _write_bytes(BANNER_FOOT)
+
+
+if __name__ == "__main__":
+    run_all(interactive=sys.stdin.isatty() and sys.stdout.isatty())
@@ -0,0 +1,148 @@
+"""
+Loop kernels used by the loop practice demo (src/loop_demo.py)
+
+Every function returns its result instead of printing, so each one can be
+timed on its own (timeit, pytest-benchmark). Inputs of _SMALL_INPUT items or
+more go through the numeric kernels, which are compiled with numba when it is
+installed. NumPy is used for those when available (never under PyPy);
+otherwise, and for small inputs, plain Python gives the same results. Both
+are imported on the first large call, so small runs never pay for them.
+"""
+
+import platform
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+# Below this many items plain Python beats NumPy conversion and numba dispatch
+_SMALL_INPUT = 1000
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Return the numpy module, importing it on first use, or None if unavailable."""
+    if platform.python_implementation() == "PyPy":
+        return None  # NumPy goes through PyPy's slow C-API emulation
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+_kernels = {}  # Kernel function -> numba-compiled version (or itself without numba)
+
+
+def _compiled(kernel):
+    """Return kernel compiled with numba, importing numba on first use."""
+    compiled = _kernels.get(kernel)
+    if compiled is None:
+        try:
+            from numba import njit
+        except ImportError:
+            compiled = kernel  # numba is optional - without it the kernel runs as plain Python
+        else:
+            compiled = njit(cache=True)(kernel)
+        _kernels[kernel] = compiled
+    return compiled
+
+
+# ============================================================================
+# NUMERIC KERNELS - compiled with numba for large inputs, see _compiled()
+# ============================================================================
+
+def _first_divisible(lo, hi, d):
+    n = lo
+    while n <= hi:
+        if n % d == 0:
+            return n  # Exit loop immediately
+        n += 1
+    return -1
+
+
+def _classify_grades(grades, pass_mark):
+    passed = grades >= pass_mark
+    return passed, passed.sum()
+
+
+def _sum_cart(prices, quantities):
+    line_totals = prices * quantities
+    return line_totals, line_totals.sum()
+
+
+# ============================================================================
+# PUBLIC FUNCTIONS - one per example that computes something
+# ============================================================================
+
+def first_divisible(lo: int, hi: int, d: int) -> int:
+    """Return the first number in lo..hi divisible by d, or -1 if none."""
+    if hi - lo < _SMALL_INPUT:
+        return _first_divisible(lo, hi, d)
+    return _compiled(_first_divisible)(lo, hi, d)
+
+
+def honor_roll(scores: Dict[str, int], threshold: int = 90) -> Dict[str, int]:
+    """Return the students whose score is at or above threshold."""
+    return {name: score for name, score in scores.items() if score >= threshold}
+
+
+def double_all(numbers: Sequence[int]) -> List[int]:
+    """Return a new list with every number doubled."""
+    return [num * 2 for num in numbers]
+
+
+def classify_grades(grades: Sequence[int], pass_mark: int = 50) -> Tuple[List[bool], int]:
+    """
+    Flag each grade as passing or failing.
+
+    Args:
+        grades: Grades to check
+        pass_mark: Lowest passing grade
+
+    Returns:
+        Tuple of (passed flag per grade, number of passing grades)
+    """
+    if len(grades) < _SMALL_INPUT or (np := _numpy()) is None:
+        passed = [grade >= pass_mark for grade in grades]
+        return passed, passed.count(True)
+
+    passed, passing_count = _compiled(_classify_grades)(np.asarray(grades, dtype=np.int32), pass_mark)
+    return passed.tolist(), int(passing_count)
+
+
+def items_affordable(balance: int, price: int) -> Tuple[int, int]:
+    """Return (items bought, remaining balance) when spending balance at price each."""
+    return divmod(balance, price)
+
+
+def skip_multiples(stop: int, step: int) -> Tuple[int, ...]:
+    """Return 1..stop without the multiples of step (no per-number modulo)."""
+    return tuple(sorted(set(range(1, stop + 1)) - set(range(step, stop + 1, step))))
+
+
+def multiplication_table(size: int) -> List[List[int]]:
+    """Return rows of products i * j for i, j in 1..size."""
+    return [[i * j for j in range(1, size + 1)] for i in range(1, size + 1)]
+
+
+def sum_cart(prices: Sequence[float], quantities: Sequence[int]) -> Tuple[List[float], float]:
+    """
+    Price a shopping cart stored as parallel price/quantity sequences.
+
+    Returns:
+        Tuple of (total per line, cart total)
+    """
+    if len(prices) < _SMALL_INPUT or (np := _numpy()) is None:
+        line_totals = [price * quantity for price, quantity in zip(prices, quantities)]
+        return line_totals, sum(line_totals)
+
+    line_totals, total = _compiled(_sum_cart)(np.asarray(prices, dtype=np.float64),
+                                              np.asarray(quantities, dtype=np.int32))
+    return line_totals.tolist(), float(total)
+
+
+def max_temp(temps: Sequence[int]) -> List[int]:
+    """Return the running maximum (entry i is the highest of temps[:i + 1])."""
+    if len(temps) < _SMALL_INPUT or (np := _numpy()) is None:
+        return list(accumulate(temps, max))
+    # The ufunc accumulate is already a single C loop - nothing for numba to add
+    return np.maximum.accumulate(np.asarray(temps, dtype=np.int32)).tolist()
@@ -0,0 +1,90 @@
+"""
+Test APIMetrics operation tracking.
+
+Usage:
+    pytest tests/test_api_metrics.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.api_common import APIMetrics
+
+
+@pytest.fixture
+def metrics() -> APIMetrics:
+    """Metrics with a small ring so tests can wrap it."""
+    return APIMetrics(capacity=4)
+
+
+def test_start_end(metrics):
+    metrics.start_operation("a")
+    metrics.start_operation("b")
+    time.sleep(0.05)
+
+    assert metrics.end_operation("a") >= 0.05
+    assert metrics.end_operation("b", success=False) >= 0.05
+    assert (metrics.total_calls, metrics.successful_calls, metrics.failed_calls) == (2, 1, 1)
+    assert metrics.success_rate == 50.0
+    assert metrics.average_response_time == pytest.approx(metrics.total_response_time / 2)
+
+
+def test_unknown_id(metrics):
+    """Ending an operation that never started is reported as 0.0 and not counted."""
+    metrics.start_operation("a")
+
+    assert metrics.end_operation("missing") == 0.0
+    assert metrics.end_operation("a") > 0.0
+    assert metrics.end_operation("a") == 0.0  # Already ended
+    assert (metrics.successful_calls, metrics.failed_calls) == (1, 0)
+
+
+def test_duplicate_id(metrics):
+    """A reused id ends its most recent start first, then the older one."""
+    metrics.start_operation("dup")
+    time.sleep(0.05)
+    metrics.start_operation("dup")
+
+    newest = metrics.end_operation("dup")
+    oldest = metrics.end_operation("dup")
+
+    assert newest < 0.05 <= oldest
+    assert metrics.end_operation("dup") == 0.0
+
+
+def test_wrap_around_overwrites_oldest(metrics):
+    """Past capacity, the oldest in-flight operations are dropped."""
+    for op in range(6):
+        metrics.start_operation(f"op{op}")
+
+    assert metrics.end_operation("op0") == 0.0  # Overwritten by op4
+    assert metrics.end_operation("op1") == 0.0  # Overwritten by op5
+    for op in range(2, 6):
+        assert metrics.end_operation(f"op{op}") > 0.0
+    assert metrics.successful_calls == 4
+    assert metrics.total_calls == 6
+
+
+def test_reset(metrics):
+    for op in range(5):
+        metrics.start_operation(f"op{op}")
+    metrics.end_operation("op4")
+
+    metrics.reset()
+
+    assert metrics.end_operation("op3") == 0.0
+    assert (metrics.total_calls, metrics.successful_calls, metrics.average_response_time) == (0, 0, 0.0)
+    metrics.start_operation("fresh")
+    assert metrics.end_operation("fresh") > 0.0
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_invalid_capacity(capacity):
+    with pytest.raises(ValueError, match="capacity"):
+        APIMetrics(capacity=capacity)
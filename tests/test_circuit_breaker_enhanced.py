@@ -5,6 +5,7 @@ Test enhanced circuit breaker functionality.
 Tests state transition logging and statistics tracking.
 """
 
+import math
 import sys
 import time
 from pathlib import Path
@@ -203,6 +204,43 @@ def test_stats_keys():
     print("✅ PASS: All statistics keys present")
 
 
+def test_to_bytes_round_trip():
+    """Test binary stats packing into a shared buffer."""
+    print("\n=== Test 9: Binary Stats (to_bytes) ===")
+
+    size = CircuitBreaker.STATS_STRUCT.size
+    buffer = bytearray(3 * size)
+    breaker = CircuitBreaker(failure_threshold=2, timeout=30)
+
+    # No failures yet: last_failure_ago packs as NaN
+    breaker.record_success()
+    assert breaker.to_bytes(buffer, size) is buffer
+    fields = CircuitBreaker.STATS_STRUCT.unpack_from(buffer, size)
+    stats = breaker.stats
+    assert fields[:6] == (0, 0, 2, 1, 0, 0.0), f"Unexpected fields: {fields}"
+    assert 0 <= fields[6] <= stats['time_in_current_state']
+    assert fields[7] == 30.0
+    assert math.isnan(fields[8]) and stats['last_failure_ago'] is None
+    print(f"Closed breaker: {fields} ✅")
+
+    # Open the circuit and pack into the last slot
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.to_bytes(buffer, 2 * size)
+    fields = CircuitBreaker.STATS_STRUCT.unpack_from(buffer, 2 * size)
+    stats = breaker.stats
+    assert fields[:6] == (2, stats['consecutive_failures'], stats['failure_threshold'],
+                          stats['total_requests'], stats['total_failures'], stats['failure_rate'])
+    assert 0 <= fields[8] <= stats['last_failure_ago']
+    assert buffer[:size] == bytes(size), "Other slots must be untouched"
+    print(f"Open breaker: {fields} ✅")
+
+    # Without a buffer a fresh one of exactly one slot is returned
+    assert len(breaker.to_bytes()) == size
+
+    print("✅ PASS: Binary stats round-trip correctly")
+
+
 def test_manual_reset():
     """Test manual reset functionality."""
     print("\n=== Test 8: Manual Reset ===")
@@ -241,6 +279,7 @@ def main():
         test_last_failure_tracking()
         test_stats_keys()
         test_manual_reset()
+        test_to_bytes_round_trip()
 
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED")
@@ -0,0 +1,41 @@
+"""
+Test month lookups in src/Date_month.py.
+
+Usage:
+    pytest tests/test_date_month.py
+"""
+
+import calendar
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.Date_month import month_info
+
+
+@pytest.mark.parametrize("date_iso,expected", [
+    ("2025-12-11", (12, "December", "Dec")),
+    ("2024-01-01", (1, "January", "Jan")),
+    ("2024-02-29", (2, "February", "Feb")),   # Leap day
+    ("2025-07-04T10:30:00", (7, "July", "Jul")),
+])
+def test_month_info(date_iso, expected):
+    assert month_info(date_iso) == expected
+
+
+def test_month_info_matches_calendar():
+    """Names come from the same locale tables as the calendar module."""
+    for month in range(1, 13):
+        assert month_info(f"2025-{month:02d}-15") == (
+            month, calendar.month_name[month], calendar.month_abbr[month]
+        )
+
+
+@pytest.mark.parametrize("date_iso", ["2025-13-01", "2025-02-30", "not a date"])
+def test_month_info_rejects_invalid_dates(date_iso):
+    with pytest.raises(ValueError):
+        month_info(date_iso)
@@ -0,0 +1,93 @@
+"""
+Test the loop kernels in src/loops.py.
+
+Kernels run on both paths: the large-input path (NumPy, compiled with numba
+when installed) forced for every input, and plain Python with NumPy
+disabled (the PyPy / no-NumPy fallback, also taken for small inputs).
+
+Usage:
+    pytest tests/test_loops.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.loops as loops
+
+
+@pytest.fixture(params=["numpy", "python"])
+def numpy_path(request, monkeypatch):
+    """Run the test on the large-input kernels, then on the plain-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(loops, "_SMALL_INPUT", 0)
+    else:
+        monkeypatch.setattr(loops, "_numpy", lambda: None)
+    return request.param
+
+
+@pytest.mark.parametrize("lo,hi,d,expected", [
+    (1, 20, 7, 7),
+    (8, 20, 7, 14),
+    (14, 14, 7, 14),
+    (1, 6, 7, -1),   # None in range
+    (5, 4, 1, -1),   # Empty range
+])
+def test_first_divisible(numpy_path, lo, hi, d, expected):
+    assert loops.first_divisible(lo, hi, d) == expected
+
+
+@pytest.mark.parametrize("grades,pass_mark,expected", [
+    ([85, 42, 50, 49, 100], 50, ([True, False, True, False, True], 3)),
+    ([10, 20], 50, ([False, False], 0)),
+    ([], 50, ([], 0)),
+])
+def test_classify_grades(numpy_path, grades, pass_mark, expected):
+    passed, passing_count = loops.classify_grades(grades, pass_mark)
+
+    assert (passed, passing_count) == expected
+    assert all(type(flag) is bool for flag in passed)
+    assert type(passing_count) is int
+
+
+@pytest.mark.parametrize("prices,quantities,expected_lines,expected_total", [
+    ([1.5, 0.25, 10.0], [2, 4, 1], [3.0, 1.0, 10.0], 14.0),
+    ([2.99], [0], [0.0], 0.0),
+    ([], [], [], 0.0),
+])
+def test_sum_cart(numpy_path, prices, quantities, expected_lines, expected_total):
+    line_totals, total = loops.sum_cart(prices, quantities)
+
+    assert line_totals == pytest.approx(expected_lines)
+    assert total == pytest.approx(expected_total)
+
+
+@pytest.mark.parametrize("temps,expected", [
+    ([22, 25, 19, 28, 24], [22, 25, 25, 28, 28]),
+    ([-5, -10, -3], [-5, -5, -3]),
+    ([7], [7]),
+    ([], []),
+])
+def test_max_temp(numpy_path, temps, expected):
+    running = loops.max_temp(temps)
+
+    assert running == expected
+    assert all(type(value) is int for value in running)
+
+
+def test_small_inputs_skip_numba():
+    """Small inputs never import NumPy or numba, so short runs don't pay their start-up cost."""
+    code = ("import sys; import src.loops as loops; "
+            "loops.first_divisible(1, 20, 7); loops.classify_grades([85, 42]); "
+            "loops.sum_cart([1.5], [2]); loops.max_temp([22, 25]); "
+            "print('numpy' in sys.modules, 'numba' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).parent.parent)
+
+    assert result.stdout.split() == ["False", "False"]
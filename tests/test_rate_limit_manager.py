@@ -0,0 +1,119 @@
+"""
+Test RateLimitManager endpoint resolution and batch planning.
+
+Usage:
+    pytest tests/test_rate_limit_manager.py
+"""
+
+import sys
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.rate_limit_manager as rate_limit_manager
+from utils.rate_limit_manager import RateLimitManager
+
+
+@pytest.fixture
+def manager() -> RateLimitManager:
+    """Fresh manager with the default 10 cps limits."""
+    return RateLimitManager(default_cps=10.0)
+
+
+def test_pool_handle_before_url(manager):
+    """A pool limiter created by name gets the pool's limits, and URLs share it."""
+    manager.configure_endpoint("github.com", 1.0, shared_pool="gh")
+
+    pool_limiter = manager.get_or_create("gh")
+
+    assert pool_limiter.rate == 1.0
+    assert manager.get_limiter("https://api.github.com/repos") is pool_limiter
+
+
+def test_domain_handle_before_url(manager):
+    """A limiter created by domain key gets the pattern the domain matches."""
+    manager.configure_endpoint("example.com", 2.0)
+
+    domain_limiter = manager.get_or_create("api.example.com")
+
+    assert domain_limiter.rate == 2.0
+    assert manager.get_limiter("https://api.example.com/v1") is domain_limiter
+
+
+def test_unconfigured_key_uses_defaults(manager):
+    """Keys matching no pool or pattern fall back to the defaults."""
+    assert manager.get_or_create("unknown.org").rate == 10.0
+
+
+@pytest.fixture(params=["ahocorasick", "linear"])
+def matcher_manager(request, monkeypatch) -> RateLimitManager:
+    """Manager matching patterns with the Aho-Corasick automaton or the linear scan."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(rate_limit_manager, "ahocorasick", None)
+    return RateLimitManager(default_cps=10.0)
+
+
+def test_first_configured_pattern_wins(matcher_manager):
+    """When several patterns match a URL, the one configured first applies."""
+    matcher_manager.configure_endpoint("users", 1.0)          # Matches last in the URL
+    matcher_manager.configure_endpoint("api.example", 2.0)    # Matches first in the URL
+    matcher_manager.configure_endpoint("example.com/v1", 3.0)
+
+    assert (matcher_manager._matcher is None) == (rate_limit_manager.ahocorasick is None)
+    assert matcher_manager.get_limiter("https://api.example.com/v1/users").rate == 1.0
+    assert matcher_manager.get_limiter("https://api.example.org/v2").rate == 2.0
+    assert matcher_manager.get_limiter("https://other.org/").rate == 10.0
+
+
+def test_exact_domain_beats_patterns(matcher_manager):
+    matcher_manager.configure_endpoint("example", 1.0)
+    matcher_manager.configure_endpoint("api.example.com", 2.0)
+
+    assert matcher_manager.get_limiter("https://api.example.com/v1").rate == 2.0
+
+
+def test_config_cache_cleared_on_configure(manager):
+    """configure_endpoint invalidates cached URL lookups."""
+    url = "https://api.github.com/repos"
+    assert manager._limiter_key(url)[0] == "api.github.com"
+
+    manager.configure_endpoint("github.com", 1.0, shared_pool="gh")
+
+    assert manager._limiter_key(url)[0] == "gh"
+
+
+def test_manager_freed_without_gc():
+    """The config cache holds no reference back to the manager."""
+    manager = RateLimitManager()
+    manager.get_limiter("https://api.example.com/v1")
+    ref = weakref.ref(manager)
+
+    del manager
+
+    assert ref() is None
+
+
+def test_batch_planning(manager):
+    """Batched token reservation across limiters."""
+    manager.configure_endpoint("api.slow.com", calls_per_second=5.0)
+
+    # Fresh limiters hold one token: example.com needs 0.1s per call, slow.com 0.2s
+    urls = [
+        "https://api.example.com/1",
+        "https://api.slow.com/1",
+        "https://api.example.com/2",
+        "https://api.example.com/3",
+        "https://api.slow.com/2",
+    ]
+    delays = manager.plan(urls)
+
+    assert isinstance(delays, np.ndarray)
+    assert delays.tolist() == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.2], abs=0.01)
+    assert manager.plan([]).shape == (0,)
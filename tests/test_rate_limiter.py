@@ -0,0 +1,128 @@
+"""
+Test RateLimiter timing.
+
+Covers RateLimiter on both of its buckets: the unit bucket used without a
+burst (the default) and the token bucket used with one.
+
+Usage:
+    pytest tests/test_rate_limiter.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.api_common as api_common
+from utils.api_common import RateLimiter
+from utils.rate_limit_manager import RateLimitManager
+
+
+def timed(func, *args) -> float:
+    """Return seconds taken by func(*args)."""
+    start = time.monotonic()
+    func(*args)
+    return time.monotonic() - start
+
+
+@pytest.mark.parametrize("burst_size,expected_bucket", [
+    (1.0, "_UnitBucket"),
+    (0.5, "_UnitBucket"),
+    (3.0, "_TokenBucket"),
+])
+def test_bucket_choice(burst_size, expected_bucket):
+    limiter = RateLimiter(10, burst_size)
+
+    assert type(limiter._bucket) is getattr(api_common, expected_bucket)
+    assert limiter.rate == 10
+    assert limiter.burst_size == max(1.0, burst_size)
+
+
+def test_unit_burst_spacing():
+    """Calls are spaced 1/rate apart, the first one free."""
+    limiter = RateLimiter(20)
+
+    elapsed = timed(lambda: [limiter.wait_if_needed() for _ in range(6)])
+
+    assert 0.24 <= elapsed < 0.35
+
+
+def test_unit_burst_rate_change_rescales_wait():
+    """Halving the rate doubles the outstanding wait."""
+    limiter = RateLimiter(10)
+    limiter.wait_if_needed()  # Use the initial token; next is 0.1s away
+
+    limiter.rate = 5
+
+    assert 0.18 <= timed(limiter.wait_if_needed) < 0.26
+    assert limiter._original_rate == 10
+
+
+def test_unit_burst_wait_for_batch():
+    """A batch waits once for all of its tokens."""
+    limiter = RateLimiter(10)
+
+    assert limiter.wait_for_batch(3) == pytest.approx(0.2, abs=0.02)
+    assert limiter.allowance == 0.0
+    assert limiter.wait_for_batch(0) == 0.0
+
+
+def test_wait_for_batch_sleeps_once():
+    """The bucket limiter prices a whole batch in one sleep."""
+    limiter = RateLimiter(calls_per_second=10)
+
+    assert limiter.wait_for_batch(1) == 0.0  # Initial token
+    slept = limiter.wait_for_batch(3)
+    assert slept == pytest.approx(0.3, abs=0.02)
+
+    # The batch consumed its tokens: the next call waits a full token
+    assert 0.08 <= timed(limiter.wait_if_needed) < 0.15
+
+
+def test_wait_for_batch_uses_burst():
+    """Accumulated burst tokens cover a batch without sleeping."""
+    limiter = RateLimiter(calls_per_second=10, burst_size=3)
+    time.sleep(0.3)  # Refill to the 3-token burst cap
+
+    assert limiter.wait_for_batch(3) == 0.0
+    assert limiter.wait_for_batch(1) == pytest.approx(0.1, abs=0.02)
+
+
+def test_burst_size_change_takes_effect():
+    """Raising burst_size swaps in a token bucket that lets tokens accumulate."""
+    limiter = RateLimiter(calls_per_second=10)
+    limiter.wait_if_needed()
+
+    limiter.burst_size = 3
+    time.sleep(0.3)
+
+    assert limiter.burst_size == 3
+    assert type(limiter._bucket) is api_common._TokenBucket
+    assert limiter.wait_for_batch(3) == 0.0
+
+
+def test_burst_size_change_keeps_reservations():
+    """Swapping bucket kinds carries outstanding reservations over."""
+    limiter = RateLimiter(calls_per_second=10, burst_size=3)
+    limiter.wait_for_batch(1)
+    assert limiter._bucket.consume(1) > 0  # Reserve the next token
+
+    limiter.burst_size = 0.5
+
+    assert limiter.burst_size == 1.0
+    assert type(limiter._bucket) is api_common._UnitBucket
+    assert 0.15 <= timed(limiter.wait_if_needed) < 0.25  # Queued behind the reservation
+
+
+def test_manager_limiter_burst_size_settable():
+    """Limiters handed out by the manager accept burst_size changes."""
+    limiter = RateLimitManager(default_cps=10).get_limiter("https://api.example.com/v1")
+
+    limiter.burst_size = 3
+    assert type(limiter._bucket) is api_common._TokenBucket
+    limiter.burst_size = 1
+    assert type(limiter._bucket) is api_common._UnitBucket
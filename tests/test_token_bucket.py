@@ -0,0 +1,144 @@
+"""
+Test that the compiled and pure-Python buckets behave the same.
+
+The compiled buckets (utils/_rate_limit_fast.pyx) replace _PyTokenBucket and
+_PyUnitBucket whenever they are built; their cases are skipped when not.
+
+Usage:
+    pytest tests/test_token_bucket.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.api_common as api_common
+from utils.api_common import RateLimiter, _PyTokenBucket, _PyUnitBucket
+
+NS_PER_TOKEN = 1_000_000_000  # 1 cps: elapsed test time is negligible next to a token
+SLACK_NS = 50_000_000         # Tolerance for time passing between calls
+
+
+def _compiled_bucket(name: str = "TokenBucket"):
+    return getattr(pytest.importorskip("utils._rate_limit_fast"), name)
+
+
+@pytest.fixture(params=["python", "compiled"])
+def bucket_cls(request):
+    """Token bucket implementation under test."""
+    return _PyTokenBucket if request.param == "python" else _compiled_bucket()
+
+
+@pytest.fixture(params=["python", "compiled"])
+def unit_bucket_cls(request):
+    """Unit bucket implementation under test."""
+    return _PyUnitBucket if request.param == "python" else _compiled_bucket("UnitBucket")
+
+
+def test_starts_with_one_token(bucket_cls):
+    bucket = bucket_cls(NS_PER_TOKEN, 3 * NS_PER_TOKEN)
+
+    assert bucket.ns_per_token == NS_PER_TOKEN
+    assert bucket.burst_ns == 3 * NS_PER_TOKEN
+    assert bucket.allowance_ns == NS_PER_TOKEN
+    assert bucket.consume(1) == 0
+
+
+def test_reserves_when_empty(bucket_cls):
+    """An unavailable token is reserved: the allowance goes negative."""
+    bucket = bucket_cls(NS_PER_TOKEN, NS_PER_TOKEN)
+    bucket.consume(1)
+
+    wait_ns = bucket.consume(1)
+
+    assert NS_PER_TOKEN - SLACK_NS < wait_ns <= NS_PER_TOKEN
+    assert bucket.allowance_ns == -wait_ns
+    assert bucket.consume(2) > 2 * NS_PER_TOKEN  # Queued behind the first reservation
+
+
+def test_burst_cap(bucket_cls):
+    """Idle time refills the bucket up to burst_ns, not beyond."""
+    bucket = bucket_cls(NS_PER_TOKEN, 3 * NS_PER_TOKEN)
+    bucket.last_ns -= 10 * NS_PER_TOKEN  # Pretend the bucket sat idle for 10 tokens
+
+    assert bucket.consume(3) == 0
+    assert bucket.allowance_ns == 0
+    assert bucket.consume(1) > NS_PER_TOKEN - SLACK_NS
+
+
+def test_set_rate_keeps_token_count(bucket_cls):
+    bucket = bucket_cls(NS_PER_TOKEN, 4 * NS_PER_TOKEN)
+    bucket.allowance_ns = 2 * NS_PER_TOKEN
+
+    bucket.set_rate(NS_PER_TOKEN // 2, 2 * NS_PER_TOKEN)
+
+    assert bucket.ns_per_token == NS_PER_TOKEN // 2
+    assert bucket.burst_ns == 2 * NS_PER_TOKEN
+    assert bucket.allowance_ns == NS_PER_TOKEN  # Still 2 tokens
+
+
+def test_set_burst_keeps_token_size(bucket_cls):
+    bucket = bucket_cls(NS_PER_TOKEN, NS_PER_TOKEN)
+    bucket.last_ns -= 10 * NS_PER_TOKEN
+
+    bucket.set_burst(3 * NS_PER_TOKEN)
+
+    assert bucket.ns_per_token == NS_PER_TOKEN
+    assert bucket.burst_ns == 3 * NS_PER_TOKEN
+    assert bucket.consume(3) == 0
+
+
+def test_rate_limiter_reads_bucket(bucket_cls, monkeypatch):
+    """RateLimiter.allowance is derived from the bucket attributes."""
+    monkeypatch.setattr(api_common, "_TokenBucket", bucket_cls)
+    limiter = RateLimiter(calls_per_second=1.0, burst_size=3.0)
+
+    assert type(limiter._bucket) is bucket_cls
+    assert limiter.allowance == 1.0
+    limiter._bucket.allowance_ns = -NS_PER_TOKEN
+    assert limiter.allowance == 0.0
+
+
+def test_unit_bucket_spacing(unit_bucket_cls):
+    """The unit bucket holds one token and spaces calls one token apart."""
+    bucket = unit_bucket_cls(NS_PER_TOKEN, NS_PER_TOKEN)
+
+    assert bucket.allowance_ns == NS_PER_TOKEN
+    assert bucket.consume(1) == 0
+    wait_ns = bucket.consume(1)
+    assert NS_PER_TOKEN - SLACK_NS < wait_ns <= NS_PER_TOKEN
+    assert bucket.allowance_ns == -wait_ns
+    assert bucket.consume(2) > 2 * NS_PER_TOKEN  # Queued behind the first reservation
+
+
+def test_unit_bucket_caps_idle_time(unit_bucket_cls):
+    """Idle time never banks more than one token."""
+    bucket = unit_bucket_cls(NS_PER_TOKEN, NS_PER_TOKEN)
+    bucket.next_ready_ns -= 10 * NS_PER_TOKEN
+
+    assert bucket.consume(1) == 0
+    assert bucket.consume(1) > NS_PER_TOKEN - SLACK_NS
+
+
+def test_unit_bucket_set_rate_rescales_reservation(unit_bucket_cls):
+    bucket = unit_bucket_cls(NS_PER_TOKEN, NS_PER_TOKEN)
+    bucket.consume(1)
+    bucket.consume(1)  # One token owed
+
+    bucket.set_rate(NS_PER_TOKEN // 2, NS_PER_TOKEN // 2)
+
+    assert bucket.ns_per_token == NS_PER_TOKEN // 2
+    assert NS_PER_TOKEN // 2 - SLACK_NS < -bucket.allowance_ns <= NS_PER_TOKEN // 2
+
+
+def test_rate_limiter_reads_unit_bucket(unit_bucket_cls, monkeypatch):
+    """RateLimiter without a burst uses the unit bucket."""
+    monkeypatch.setattr(api_common, "_UnitBucket", unit_bucket_cls)
+    limiter = RateLimiter(calls_per_second=1.0)
+
+    assert type(limiter._bucket) is unit_bucket_cls
+    assert limiter.allowance == 1.0
@@ -9,21 +9,156 @@ Provides:
 - Common API patterns
 """
 
-import time
+import logging
 import random
-from typing import Dict, Any, Optional, Callable
+import struct
+import threading
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
+from time import monotonic as _monotonic, monotonic_ns as _monotonic_ns, sleep as _sleep
+from typing import Dict, Any, List, Optional, Callable, Tuple
 
 from utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Default jitter (factor 0.8-1.2) as min + spread, with random.random bound once
+_RAND = random.random
+_JITTER_MIN = 0.8
+_SPREAD = 0.4
+
+
+class _PyTokenBucket:
+    """
+    Token bucket core kept in integer nanoseconds (one token = ns_per_token ns).
+
+    Pure-Python implementation. utils/_rate_limit_fast.pyx provides a compiled
+    drop-in with the same interface, used automatically once it is built.
+    """
+    __slots__ = ['ns_per_token', 'burst_ns', 'allowance_ns', 'last_ns', '_lock']
+
+    def __init__(self, ns_per_token: int, burst_ns: int, allowance_ns: Optional[int] = None):
+        self.ns_per_token = ns_per_token
+        self.burst_ns = burst_ns
+        self.allowance_ns = ns_per_token if allowance_ns is None else allowance_ns  # Default: one token
+        self.last_ns = _monotonic_ns()
+        self._lock = threading.Lock()
+
+    def set_rate(self, ns_per_token: int, burst_ns: int) -> None:
+        """Change the token size, keeping the accumulated token count."""
+        with self._lock:
+            self.allowance_ns = self.allowance_ns * ns_per_token // self.ns_per_token
+            self.ns_per_token = ns_per_token
+            self.burst_ns = burst_ns
+
+    def set_burst(self, burst_ns: int) -> None:
+        """Change the burst cap, leaving the token size alone."""
+        with self._lock:
+            self.burst_ns = burst_ns
+
+    def consume(self, tokens: int = 1) -> int:
+        """
+        Take tokens from the bucket.
+
+        If they are not available yet they are reserved anyway (the allowance
+        goes negative) so concurrent callers queue up behind each other
+        instead of all waking at the same moment.
+
+        Returns:
+            Nanoseconds to wait before the tokens may be used (0 = use now)
+        """
+        with self._lock:
+            now = _monotonic_ns()
+            # Cap at burst_size instead of rate
+            allowance_ns = min(self.burst_ns, self.allowance_ns + now - self.last_ns)
+            allowance_ns -= tokens * self.ns_per_token
+            self.last_ns = now
+            self.allowance_ns = allowance_ns
+        return -allowance_ns if allowance_ns < 0 else 0
+
+
+class _PyUnitBucket:
+    """
+    Bucket for burst_size 1.0 (the default), with the _PyTokenBucket interface.
+
+    With a one-token cap nothing accumulates, so it only tracks when the next
+    token is ready (one every ns_per_token ns). allowance_ns is kept as of the
+    last consume() for RateLimiter.allowance.
+    """
+    __slots__ = ['ns_per_token', 'burst_ns', 'allowance_ns', 'next_ready_ns', '_lock']
+
+    def __init__(self, ns_per_token: int, burst_ns: int, allowance_ns: Optional[int] = None):
+        if allowance_ns is None:
+            allowance_ns = ns_per_token  # Start with one token
+        self.ns_per_token = ns_per_token
+        self.burst_ns = burst_ns
+        self.allowance_ns = min(allowance_ns, ns_per_token)
+        self.next_ready_ns = _monotonic_ns() + ns_per_token - self.allowance_ns
+        self._lock = threading.Lock()
+
+    def set_rate(self, ns_per_token: int, burst_ns: int) -> None:
+        """Change the token size, rescaling outstanding reservations."""
+        with self._lock:
+            now = _monotonic_ns()
+            owed_ns = self.next_ready_ns - now
+            if owed_ns > 0:
+                self.next_ready_ns = now + owed_ns * ns_per_token // self.ns_per_token
+            self.allowance_ns = self.allowance_ns * ns_per_token // self.ns_per_token
+            self.ns_per_token = ns_per_token
+            self.burst_ns = burst_ns
+
+    def set_burst(self, burst_ns: int) -> None:
+        """Record the burst cap (a unit bucket never holds more than one token)."""
+        with self._lock:
+            self.burst_ns = burst_ns
+
+    def consume(self, tokens: int = 1) -> int:
+        """
+        Take tokens, reserving them if not yet available.
+
+        Returns:
+            Nanoseconds to wait before the last token may be used (0 = use now)
+        """
+        with self._lock:
+            now = _monotonic_ns()
+            ready = self.next_ready_ns
+            if ready < now:
+                ready = now
+            ready += tokens * self.ns_per_token
+            self.next_ready_ns = ready
+            # The last token is usable one token before the next one is ready
+            wait_ns = ready - self.ns_per_token - now
+            self.allowance_ns = -wait_ns
+        return wait_ns
+
+
+try:
+    # Optional compiled buckets - see utils/_rate_limit_fast.pyx for the build steps
+    from utils._rate_limit_fast import TokenBucket as _TokenBucket, UnitBucket as _UnitBucket
+except ImportError:
+    _TokenBucket = _PyTokenBucket
+    _UnitBucket = _PyUnitBucket
+
 
 class RateLimiter:
     """
     Simple rate limiter using token bucket algorithm.
 
     Limits the rate of API calls to prevent hitting rate limits.
+    Time is tracked with time.monotonic_ns() and the bucket is kept in
+    integer nanoseconds (one token = 1e9 / rate ns), so it is immune to
+    wall-clock jumps and avoids float math on every call.
+
+    Without a burst (burst_size 1.0, the default) a unit bucket is used that
+    only tracks when the next call may go; changing burst_size swaps between
+    the two bucket kinds.
+
+    Thread-safe: the bucket arithmetic is atomic per limiter, but no lock
+    is ever held while sleeping.
     """
+    __slots__ = ['_burst_size', '_original_rate', '_rate', '_bucket']
+
     def __init__(self,
                  calls_per_second: float = 10,
                  burst_size: float = 1.0):
@@ -34,29 +169,118 @@ class RateLimiter:
             calls_per_second: Sustained rate limit
             burst_size: Max tokens that can accumulate (1.0 = no burst)
         """
-        self.rate = calls_per_second
-        self.burst_size = max(1.0, burst_size)
-        self.allowance = min(1.0, self.burst_size)
-        self.last_check = time.time()
+        self._burst_size = max(1.0, burst_size)
+        self._bucket = None
+        self.rate = calls_per_second  # Creates the bucket
+        self._original_rate = calls_per_second  # Recovery target for adaptive slow-downs
+
+    @property
+    def rate(self) -> float:
+        """Sustained rate in calls per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, calls_per_second: float) -> None:
+        ns_per_token = int(1e9 / calls_per_second)
+        burst_ns = int(ns_per_token * self._burst_size)
+        self._rate = calls_per_second
+
+        if self._bucket is None:
+            self._bucket = self._new_bucket(ns_per_token)
+        else:
+            self._bucket.set_rate(ns_per_token, burst_ns)
+
+    def _new_bucket(self, ns_per_token: int, allowance_ns: Optional[int] = None):
+        """Create the bucket kind matching burst_size (unit bucket when there is no burst)."""
+        bucket_cls = _UnitBucket if self._burst_size <= 1.0 else _TokenBucket
+        return bucket_cls(ns_per_token, int(ns_per_token * self._burst_size), allowance_ns)
+
+    @property
+    def burst_size(self) -> float:
+        """Max tokens that can accumulate (1.0 = no burst)."""
+        return self._burst_size
+
+    @burst_size.setter
+    def burst_size(self, burst_size: float) -> None:
+        was_unit = self._burst_size <= 1.0
+        self._burst_size = max(1.0, burst_size)
+        bucket = self._bucket
+
+        if (self._burst_size <= 1.0) == was_unit:
+            bucket.set_burst(int(bucket.ns_per_token * self._burst_size))
+        else:
+            # Switch bucket kind, carrying the allowance (and any reservations) over
+            self._bucket = self._new_bucket(bucket.ns_per_token, bucket.allowance_ns)
+
+    @property
+    def allowance(self) -> float:
+        """Tokens currently available (as of the last wait_if_needed call)."""
+        bucket = self._bucket
+        return max(0.0, bucket.allowance_ns / bucket.ns_per_token)
+
+    def _try_consume(self) -> Optional[float]:
+        """
+        Take one token from the bucket.
+
+        Returns:
+            None if a token was available, else seconds to sleep before using it
+        """
+        wait_ns = self._bucket.consume(1)
+        return wait_ns / 1e9 if wait_ns else None
+
+    def _reserve(self, tokens: int) -> Tuple[int, int]:
+        """
+        Take tokens from the bucket, reserving them if not yet available.
+
+        Returns:
+            Tuple of (ns to wait before the last token may be used, ns per token)
+        """
+        bucket = self._bucket
+        return bucket.consume(tokens), bucket.ns_per_token
 
     def wait_if_needed(self) -> None:
-        current = time.time()
-        time_passed = current - self.last_check
-        self.last_check = current
+        sleep_time = self._try_consume()
+        if sleep_time is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Rate limiting: sleeping {sleep_time:.3f}s")
+            _sleep(sleep_time)
 
-        self.allowance += time_passed * self.rate
+    def wait_for_batch(self, n: int) -> float:
+        """
+        Wait until n calls may be made at once, taking all n tokens in one step.
 
-        # Cap at burst_size instead of rate
-        if self.allowance > self.burst_size:
-            self.allowance = self.burst_size
+        Equivalent to n wait_if_needed() calls, but prices the whole batch
+        with a single bucket update and sleeps at most once.
 
-        if self.allowance < 1.0:
-            sleep_time = (1.0 - self.allowance) / self.rate
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.3f}s")
-            time.sleep(sleep_time)
-            self.allowance = 0.0
-        else:
-            self.allowance -= 1.0
+        Args:
+            n: Number of calls in the batch
+
+        Returns:
+            Seconds slept (0.0 if the tokens were already available)
+        """
+        if n <= 0:
+            return 0.0
+
+        wait_ns, _ = self._reserve(n)
+        if not wait_ns:
+            return 0.0
+
+        sleep_time = wait_ns / 1e9
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Rate limiting: sleeping {sleep_time:.3f}s for batch of {n}")
+        _sleep(sleep_time)
+        return sleep_time
+
+
+class _BreakerState(IntEnum):
+    """Circuit breaker states, stored in the high bits of _state_and_failures."""
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+# State names as reported by CircuitBreaker.stats, indexed by _BreakerState
+_STATE_NAMES = ("closed", "half-open", "open")
 
 
 class CircuitBreaker:
@@ -71,9 +295,21 @@ class CircuitBreaker:
     - closed: Normal operation, all calls allowed
     - open: Too many failures, calls blocked
     - half-open: Testing recovery, one call allowed
+
+    State and consecutive failure count share one int,
+    (state << 32) | failures, so counting a failure is a single add.
     """
-    __slots__ = ['failure_threshold', 'timeout', '_failures', '_last_failure', '_state',
-                 '_state_changed_at', '_total_requests', '_total_failures']
+    __slots__ = ['failure_threshold', 'timeout', '_state_and_failures', '_last_failure',
+                 '_open_until', '_state_changed_at', '_total_requests', '_total_failures',
+                 '_failure_rate', '_rate_dirty', '_stats_scratch']
+
+    _STATE_SHIFT = 32
+    _FAILURE_MASK = (1 << _STATE_SHIFT) - 1
+
+    # Binary stats layout for to_bytes(): state (_BreakerState value), consecutive
+    # failures, threshold, total requests, total failures, failure rate, time in
+    # state, timeout, last failure ago (NaN if no failure yet)
+    STATS_STRUCT = struct.Struct('<BIIQQdddd')
 
     def __init__(self, failure_threshold: int = 5, timeout: int = 60):
         """
@@ -85,57 +321,73 @@ class CircuitBreaker:
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
-        self._failures = 0
-        self._last_failure = 0.0
-        self._state = "closed"
-        self._state_changed_at = time.time()
+        self._state_and_failures = _BreakerState.CLOSED << self._STATE_SHIFT
+        self._last_failure: Optional[float] = None  # time.monotonic() of last failure
+        self._open_until = 0.0  # time.monotonic() at which an open circuit half-opens
+        self._state_changed_at = _monotonic()
         self._total_requests = 0
         self._total_failures = 0
+        self._failure_rate = 0.0
+        self._rate_dirty = False  # Set when the totals change, cleared by stats
+        self._stats_scratch: Dict[str, Any] = {}
 
-    def _change_state(self, new_state: str, reason: str = "") -> None:
+    def _change_state(self, new_state: _BreakerState, reason: str = "") -> None:
         """
         Change circuit breaker state with logging.
 
         Args:
-            new_state: Target state (closed, open, half-open)
+            new_state: Target state
             reason: Reason for state change
         """
-        if new_state != self._state:
-            old_state = self._state
-            time_in_state = time.time() - self._state_changed_at
+        packed = self._state_and_failures
+        old_state = packed >> self._STATE_SHIFT
+        if new_state != old_state:
+            now = _monotonic()
+            time_in_state = now - self._state_changed_at
+            old_name = _STATE_NAMES[old_state]
 
             logger.info(
-                f"Circuit breaker state: {old_state} → {new_state} "
-                f"(was in {old_state} for {time_in_state:.1f}s) - {reason}"
+                f"Circuit breaker state: {old_name} → {_STATE_NAMES[new_state]} "
+                f"(was in {old_name} for {time_in_state:.1f}s) - {reason}"
             )
 
-            self._state = new_state
-            self._state_changed_at = time.time()
+            self._state_and_failures = (new_state << self._STATE_SHIFT) | (packed & self._FAILURE_MASK)
+            self._state_changed_at = now
+            if new_state == _BreakerState.OPEN:
+                self._open_until = now + self.timeout
 
     def record_success(self) -> None:
         """Record a successful operation with state transition logging."""
         self._total_requests += 1
-        self._failures = 0
+        self._rate_dirty = True
+        packed = self._state_and_failures & ~self._FAILURE_MASK  # Clear failures, keep state
+        self._state_and_failures = packed
 
-        if self._state != "closed":
-            self._change_state("closed", "Success after failure")
-        else:
+        if packed:  # Not closed
+            self._change_state(_BreakerState.CLOSED, "Success after failure")
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug("Circuit breaker: success recorded")
 
     def record_failure(self) -> None:
         """Record a failed operation with state transition logging."""
         self._total_requests += 1
         self._total_failures += 1
-        self._failures += 1
-        self._last_failure = time.time()
+        self._rate_dirty = True
+        self._last_failure = _monotonic()
 
-        if self._failures >= self.failure_threshold and self._state != "open":
-            self._change_state(
-                "open",
-                f"{self._failures} consecutive failures (threshold: {self.failure_threshold})"
-            )
-        elif self._state != "open":
-            logger.debug(f"Circuit breaker: failure {self._failures}/{self.failure_threshold}")
+        packed = self._state_and_failures + 1  # Failures live in the low bits
+        self._state_and_failures = packed
+        state = packed >> self._STATE_SHIFT
+
+        if state != _BreakerState.OPEN:
+            failures = packed & self._FAILURE_MASK
+            if failures >= self.failure_threshold:
+                self._change_state(
+                    _BreakerState.OPEN,
+                    f"{failures} consecutive failures (threshold: {self.failure_threshold})"
+                )
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Circuit breaker: failure {failures}/{self.failure_threshold}")
 
     def is_open(self) -> bool:
         """
@@ -144,30 +396,40 @@ class CircuitBreaker:
         Returns:
             True if circuit is open and calls should be blocked
         """
-        if self._state == "closed":
+        # Closed and half-open both allow calls
+        if self._state_and_failures >> self._STATE_SHIFT != _BreakerState.OPEN:
             return False
 
-        # Check if timeout has passed
-        if self._state == "open":
-            if time.time() - self._last_failure >= self.timeout:
-                self._change_state(
-                    "half-open",
-                    f"Timeout expired ({self.timeout}s since last failure)"
-                )
-                return False  # Allow one attempt
+        if _monotonic() < self._open_until:
+            return True
 
-        return self._state == "open"
+        self._change_state(
+            _BreakerState.HALF_OPEN,
+            f"Timeout expired ({self.timeout}s since circuit opened)"
+        )
+        return False  # Allow one attempt
 
     def reset(self) -> None:
         """Reset the circuit breaker with state logging."""
-        self._failures = 0
-        self._change_state("closed", "Manual reset")
+        self._state_and_failures &= ~self._FAILURE_MASK
+        self._change_state(_BreakerState.CLOSED, "Manual reset")
+
+    @property
+    def failure_rate(self) -> float:
+        """Failure rate over all recorded requests (recomputed only when the totals change)."""
+        if self._rate_dirty:
+            self._failure_rate = self._total_failures / max(1, self._total_requests)
+            self._rate_dirty = False
+        return self._failure_rate
 
     @property
     def stats(self) -> Dict[str, Any]:
         """
         Get circuit breaker statistics for monitoring.
 
+        The same dict is updated in place on every access, so monitoring polls
+        don't allocate; copy it (dict(breaker.stats)) to keep a snapshot.
+
         Returns:
             Dictionary with current state, failure counts, and metrics
 
@@ -177,17 +439,52 @@ class CircuitBreaker:
             > stats = breaker.stats
             > print(f"State: {stats['state']}, Failure rate: {stats['failure_rate']:.1%}")
         """
-        return {
-            'state': self._state,
-            'consecutive_failures': self._failures,
-            'failure_threshold': self.failure_threshold,
-            'total_requests': self._total_requests,
-            'total_failures': self._total_failures,
-            'failure_rate': self._total_failures / max(1, self._total_requests),
-            'time_in_current_state': time.time() - self._state_changed_at,
-            'timeout_seconds': self.timeout,
-            'last_failure_ago': time.time() - self._last_failure if self._last_failure > 0 else None
-        }
+        now = _monotonic()
+        stats = self._stats_scratch
+        packed = self._state_and_failures
+        stats['state'] = _STATE_NAMES[packed >> self._STATE_SHIFT]
+        stats['consecutive_failures'] = packed & self._FAILURE_MASK
+        stats['failure_threshold'] = self.failure_threshold
+        stats['total_requests'] = self._total_requests
+        stats['total_failures'] = self._total_failures
+        stats['failure_rate'] = self.failure_rate
+        stats['time_in_current_state'] = now - self._state_changed_at
+        stats['timeout_seconds'] = self.timeout
+        stats['last_failure_ago'] = now - self._last_failure if self._last_failure is not None else None
+        return stats
+
+    def to_bytes(self, buffer: Optional[bytearray] = None, offset: int = 0) -> bytearray:
+        """
+        Encode the current statistics in STATS_STRUCT layout.
+
+        Exporters handling many breakers can preallocate one buffer of
+        n * STATS_STRUCT.size bytes and pack every breaker into its own slot.
+
+        Args:
+            buffer: Buffer to pack into (default: a new bytearray)
+            offset: Byte offset of this breaker's slot in buffer
+
+        Returns:
+            The buffer that was written to
+        """
+        if buffer is None:
+            buffer = bytearray(self.STATS_STRUCT.size)
+
+        now = _monotonic()
+        packed = self._state_and_failures
+        self.STATS_STRUCT.pack_into(
+            buffer, offset,
+            packed >> self._STATE_SHIFT,
+            packed & self._FAILURE_MASK,
+            self.failure_threshold,
+            self._total_requests,
+            self._total_failures,
+            self.failure_rate,
+            now - self._state_changed_at,
+            self.timeout,
+            now - self._last_failure if self._last_failure is not None else float('nan')
+        )
+        return buffer
 
 
 def apply_jitter(delay: float, jitter_config: Optional[Dict[str, Any]] = None) -> float:
@@ -202,19 +499,25 @@ def apply_jitter(delay: float, jitter_config: Optional[Dict[str, Any]] = None) -
         Jittered delay value
     """
     if not jitter_config:
-        jitter_config = {"min-factor": 0.8, "max-factor": 1.2}
-
-    min_factor = jitter_config["min-factor"]  # Hard-fail if missing
-    max_factor = jitter_config["max-factor"]  # Hard-fail if missing
+        jittered = delay * (_JITTER_MIN + _SPREAD * _RAND())
+    else:
+        min_factor = jitter_config["min-factor"]  # Hard-fail if missing
+        max_factor = jitter_config["max-factor"]  # Hard-fail if missing
 
-    # Apply random jitter within the factor range
-    jitter_factor = random.uniform(min_factor, max_factor)
-    jittered = delay * jitter_factor
+        # Apply random jitter within the factor range
+        jittered = delay * (min_factor + (max_factor - min_factor) * _RAND())
 
-    logger.debug(f"Applied jitter: {delay:.2f}s -> {jittered:.2f}s")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Applied jitter: {delay:.2f}s -> {jittered:.2f}s")
     return jittered
 
 
+@lru_cache(maxsize=64)
+def _backoff_schedule(max_retries: int, backoff: float) -> Tuple[float, ...]:
+    """Return the base delay before each retry: backoff ** attempt (cached per configuration)."""
+    return tuple(backoff ** attempt for attempt in range(max_retries - 1))
+
+
 def manual_retry(func: Callable, *args,
                  max_retries: int = 3,
                  backoff: float = 2.0,
@@ -238,6 +541,7 @@ def manual_retry(func: Callable, *args,
         Last exception if all retries fail
     """
     last_exception = None
+    delays = _backoff_schedule(max_retries, backoff)
 
     for attempt in range(max_retries):
         try:
@@ -246,12 +550,12 @@ def manual_retry(func: Callable, *args,
             last_exception = e
 
             if attempt < max_retries - 1:
-                delay = backoff ** attempt
-                jittered_delay = apply_jitter(delay, jitter_config)
+                jittered_delay = apply_jitter(delays[attempt], jitter_config)
 
                 logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
-                logger.debug(f"Retrying in {jittered_delay:.2f}s")
-                time.sleep(jittered_delay)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Retrying in {jittered_delay:.2f}s")
+                _sleep(jittered_delay)
             else:
                 logger.error(f"All {max_retries} attempts failed")
 
@@ -263,20 +567,51 @@ class APIMetrics:
     Simple metrics collector for API operations.
 
     Tracks success/failure rates and response times.
+
+    In-flight operations live in a fixed-size ring buffer (parallel id and
+    start-time lists), so operations that never end are overwritten instead
+    of accumulating. With more than `capacity` operations in flight the
+    oldest are dropped.
     """
 
-    def __init__(self):
-        """Initialize metrics collector."""
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize metrics collector.
+
+        Args:
+            capacity: Maximum number of operations tracked in flight at once
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
         self.total_calls = 0
         self.successful_calls = 0
         self.failed_calls = 0
         self.total_response_time = 0.0
-        self._start_times: Dict[str, float] = {}
+        self._average_response_time = 0.0  # total_response_time / total_calls, kept current
+        self._capacity = capacity
+        self._ids: List[Optional[str]] = [None] * capacity
+        self._starts_ns = [0] * capacity
+        self._head = 0  # Next slot to write
+        self._wrapped = False  # True once every slot has been written
 
     def start_operation(self, operation_id: str) -> None:
         """Mark the start of an operation."""
-        self._start_times[operation_id] = time.time()
+        head = self._head
+        self._ids[head] = operation_id
+        self._starts_ns[head] = _monotonic_ns()
+
+        head += 1
+        if head == self._capacity:
+            head = 0
+            self._wrapped = True
+        self._head = head
+
         self.total_calls += 1
+        self._average_response_time = self.total_response_time / self.total_calls
 
     def end_operation(self, operation_id: str, success: bool = True) -> float:
         """
@@ -289,12 +624,27 @@ class APIMetrics:
         Returns:
             Operation duration in seconds
         """
-        if operation_id not in self._start_times:
+        end_ns = _monotonic_ns()
+        ids = self._ids
+        head = self._head
+
+        # Scan back from the newest slot to the oldest written one -
+        # operations usually end in LIFO order
+        slots = range(head - 1, -1, -1)
+        if self._wrapped:
+            slots = chain(slots, range(self._capacity - 1, head - 1, -1))
+
+        for slot in slots:
+            if ids[slot] == operation_id:
+                break
+        else:
             logger.warning(f"No start time for operation {operation_id}")
             return 0.0
 
-        duration = time.time() - self._start_times.pop(operation_id)
+        ids[slot] = None  # Free the slot so the operation can't end twice
+        duration = (end_ns - self._starts_ns[slot]) / 1e9
         self.total_response_time += duration
+        self._average_response_time = self.total_response_time / self.total_calls
 
         if success:
             self.successful_calls += 1
@@ -312,10 +662,8 @@ class APIMetrics:
 
     @property
     def average_response_time(self) -> float:
-        """Calculate average response time in seconds."""
-        if self.total_calls == 0:
-            return 0.0
-        return self.total_response_time / self.total_calls
+        """Average response time in seconds (kept current by start/end_operation)."""
+        return self._average_response_time
 
     def reset(self) -> None:
         """Reset all metrics."""
@@ -323,7 +671,10 @@ class APIMetrics:
         self.successful_calls = 0
         self.failed_calls = 0
         self.total_response_time = 0.0
-        self._start_times.clear()
+        self._average_response_time = 0.0
+        self._ids = [None] * self._capacity
+        self._head = 0
+        self._wrapped = False
 
     def __str__(self) -> str:
         """String representation of metrics."""
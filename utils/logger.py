@@ -663,6 +663,14 @@ class TxoLogger:
         """Log exception with traceback and redaction."""
         self.logger.exception(msg, *args, **kwargs)
 
+    def log(self, level: int, msg: str, *args, **kwargs) -> None:
+        """Log message at an explicit level with redaction."""
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if a message at level would be emitted (skip formatting when not)."""
+        return self.logger.isEnabledFor(level)
+
 
 def setup_logger(strict: bool = False) -> TxoLogger:
     """
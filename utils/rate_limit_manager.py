@@ -1,15 +1,48 @@
 # utils/rate_limit_manager.py
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+import logging
 import threading
-import time
+from time import gmtime, strftime, time as _time
 from urllib.parse import urlparse
 
+import numpy as np
+
 from utils.api_common import RateLimiter
 from utils.logger import setup_logger
 
+try:
+    import ahocorasick  # Optional: pyahocorasick for O(len(url)) pattern matching
+except ImportError:
+    ahocorasick = None
+
 logger = setup_logger()
 
+# Rate limit headers read by update_from_headers(), in unpacking order
+_RL_HEADER_KEYS = ('X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset', 'Retry-After')
+_RL_HEADER_KEYS_LOWER = tuple(key.lower() for key in _RL_HEADER_KEYS)
+
+
+@lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """Return the netloc of url (cached - callers hit the same URLs repeatedly)."""
+    return urlparse(url).netloc
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """
+    Parse an integer header value without raising.
+
+    Returns:
+        The integer value, or None if value is not an integer
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
 
 @dataclass
 class EndpointLimits:
@@ -29,6 +62,18 @@ class RateLimitManager:
     - Dynamic limit updates from response headers
     """
 
+    # Adaptive slow-down tiers, indexed by bisect_right(_TIER_THRESHOLDS, remaining_pct):
+    # (rate multiplier, minimum rate, log level, status, action)
+    _TIER_THRESHOLDS = (0.05, 0.10, 0.25)
+    _SLOWDOWN_TIERS = (
+        (0.3, 0.1, logging.WARNING, "CRITICAL", "Emergency slow down"),    # <5% remaining
+        (0.5, 0.5, logging.WARNING, "LOW", "Aggressive slow down"),        # <10% remaining
+        (0.75, 1.0, logging.INFO, "depleting", "Moderate slow down"),      # <25% remaining
+    )
+    _SPEEDUP_THRESHOLD = 0.75  # Above this, recover towards the original rate
+
+    _CONFIG_CACHE_SIZE = 4096  # Max URLs in the config cache before it is reset
+
     def __init__(self, default_cps: float = 10, default_burst: float = 1.0):
         self.default_cps = default_cps
         self.default_burst = default_burst
@@ -38,6 +83,14 @@ class RateLimitManager:
         # Endpoint-specific configurations
         self._endpoint_configs: Dict[str, EndpointLimits] = {}
 
+        # Pattern -> configuration order, and a matcher over all patterns
+        # (rebuilt by configure_endpoint when pyahocorasick is installed)
+        self._pattern_order: Dict[str, int] = {}
+        self._matcher = None
+
+        # URL -> config cache, cleared by configure_endpoint() and when full
+        self._config_cache: Dict[str, EndpointLimits] = {}
+
     def configure_endpoint(self, pattern: str,
                            calls_per_second: float,
                            burst_size: float = 1.0,
@@ -54,30 +107,130 @@ class RateLimitManager:
         self._endpoint_configs[pattern] = EndpointLimits(
             calls_per_second, burst_size, shared_pool
         )
+        self._pattern_order.setdefault(pattern, len(self._pattern_order))
+        self._rebuild_matcher()
+        self._config_cache.clear()
+
+    def _rebuild_matcher(self) -> None:
+        """Build an Aho-Corasick automaton over all configured patterns."""
+        if ahocorasick is None:
+            return
+
+        matcher = ahocorasick.Automaton()
+        for pattern in self._endpoint_configs:
+            matcher.add_word(pattern, pattern)
+        matcher.make_automaton()
+        self._matcher = matcher
 
     def get_limiter(self, url: str) -> RateLimiter:
         """Get or create rate limiter for URL."""
+        key, config = self._limiter_key(url)
+        return self.get_or_create(key, config)
+
+    def _limiter_key(self, url: str) -> Tuple[str, EndpointLimits]:
+        """Return (limiter key, configuration) for URL."""
         # Extract domain as default key
-        parsed = urlparse(url)
-        domain = parsed.netloc
+        domain = _domain_of(url)
 
         # Find matching configuration
-        config = self._find_config(url, domain)
+        config = self._config_cache.get(url)
+        if config is None:
+            config = self._find_config(url, domain)
+            if len(self._config_cache) >= self._CONFIG_CACHE_SIZE:
+                self._config_cache.clear()
+            self._config_cache[url] = config
 
         # Use shared pool name if configured, else use domain
-        key = config.shared_pool if config.shared_pool else domain
+        return (config.shared_pool if config.shared_pool else domain), config
+
+    def plan(self, urls: List[str]) -> np.ndarray:
+        """
+        Reserve tokens for a batch of requests and return when each may be sent.
+
+        URLs are grouped by limiter (domain or shared pool); each limiter is
+        charged once for its whole group, and the k-th request of a group is
+        scheduled k tokens after the first. Callers then send request i after
+        sleeping delays[i] seconds instead of calling wait_if_needed() per URL.
+
+        Args:
+            urls: Request URLs in send order
+
+        Returns:
+            Per-request delays in seconds from now (float64)
+        """
+        if not urls:
+            return np.zeros(0)
+
+        resolved = [self._limiter_key(url) for url in urls]
+        configs = {key: config for key, config in resolved}
+
+        keys, inverse = np.unique([key for key, _ in resolved], return_inverse=True)
+        counts = np.bincount(inverse)
+
+        # Charge each limiter once: wait for its last token, and its token size
+        wait_ns = np.empty(len(keys), dtype=np.int64)
+        ns_per_token = np.empty(len(keys), dtype=np.int64)
+        for group, key in enumerate(keys.tolist()):
+            limiter = self.get_or_create(key, configs[key])
+            wait_ns[group], ns_per_token[group] = limiter._reserve(int(counts[group]))
+
+        # Position of each request within its group, in send order
+        order = np.argsort(inverse, kind='stable')
+        rank = np.empty(len(urls), dtype=np.int64)
+        rank[order] = np.arange(len(urls)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        # Token k of a group is ready (count - 1 - k) tokens before the last one
+        lead_ns = (counts[inverse] - 1 - rank) * ns_per_token[inverse]
+        return np.maximum(wait_ns[inverse] - lead_ns, 0) / 1e9
+
+    def get_or_create(self, key: str, config: Optional[EndpointLimits] = None) -> RateLimiter:
+        """
+        Get or create the rate limiter stored under key.
+
+        Long-lived callers can hold on to the returned limiter and call
+        wait_if_needed() on it directly, skipping the manager on every request.
+
+        Args:
+            key: Limiter key (domain or shared pool name)
+            config: Limits for a new limiter (default: the shared pool or domain
+                configuration matching key, else defaults)
+
+        Returns:
+            The shared RateLimiter for key
+        """
+        # Fast path: dict reads are atomic under the GIL, so no lock on a hit
+        limiter = self._limiters.get(key)
+        if limiter is not None:
+            return limiter
+
+        if config is None:
+            config = self._config_for_key(key)
 
         with self._lock:
-            if key not in self._limiters:
-                self._limiters[key] = RateLimiter(
+            # Re-check: another thread may have created it while we waited
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = RateLimiter(
                     config.calls_per_second,
                     config.burst_size
                 )
-                logger.debug(f"Created rate limiter for {key}: "
-                             f"{config.calls_per_second} cps, "
-                             f"burst={config.burst_size}")
+                self._limiters[key] = limiter
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Created rate limiter for {key}: "
+                                 f"{config.calls_per_second} cps, "
+                                 f"burst={config.burst_size}")
+
+            return limiter
+
+    def _config_for_key(self, key: str) -> EndpointLimits:
+        """Find the configuration for a limiter key (shared pool name or domain)."""
+        # Pools are named by their endpoints; first-configured endpoint wins
+        for config in self._endpoint_configs.values():
+            if config.shared_pool == key:
+                return config
 
-            return self._limiters[key]
+        # Otherwise the key is a domain - match it like a URL
+        return self._find_config(key, key)
 
     def _find_config(self, url: str, domain: str) -> EndpointLimits:
         """Find best matching configuration for URL."""
@@ -86,9 +239,15 @@ class RateLimitManager:
             return self._endpoint_configs[domain]
 
         # Check patterns (simplified - could use fnmatch)
-        for pattern, config in self._endpoint_configs.items():
-            if pattern in url:
-                return config
+        if self._matcher is not None:
+            # Single pass over the URL; first-configured pattern wins, as below
+            matched = [pattern for _, pattern in self._matcher.iter(url)]
+            if matched:
+                return self._endpoint_configs[min(matched, key=self._pattern_order.__getitem__)]
+        else:
+            for pattern, config in self._endpoint_configs.items():
+                if pattern in url:
+                    return config
 
         # Return defaults
         return EndpointLimits(self.default_cps, self.default_burst)
@@ -113,106 +272,109 @@ class RateLimitManager:
             url: API endpoint URL
             headers: HTTP response headers
         """
-        limit = headers.get('X-RateLimit-Limit')
-        remaining = headers.get('X-RateLimit-Remaining')
-        reset = headers.get('X-RateLimit-Reset')
-        retry_after = headers.get('Retry-After')
+        limit, remaining, reset, retry_after = map(headers.get, _RL_HEADER_KEYS)
 
-        # No rate limit headers - nothing to do
         if not (limit and remaining):
-            return
+            # HTTP/2 header names are lower-case once copied into a plain dict
+            limit, remaining, reset, retry_after = map(headers.get, _RL_HEADER_KEYS_LOWER)
 
-        limiter = self.get_limiter(url)
+            # No rate limit headers - nothing to do
+            if not (limit and remaining):
+                return
 
-        try:
-            limit_int = int(limit)
-            remaining_int = int(remaining)
+        limit_int = _parse_int(limit)
+        remaining_int = _parse_int(remaining)
+        if limit_int is None or remaining_int is None:
+            logger.warning(f"Invalid rate limit headers for {url}: limit={limit!r}, remaining={remaining!r}")
+            return
 
-            # Calculate remaining percentage
-            remaining_pct = remaining_int / limit_int if limit_int > 0 else 1.0
+        # Fast path: stable zone (25%-75% remaining, the common case) with no
+        # Retry-After and no passed reset leaves the limiter untouched. Integer
+        # bounds avoid the division; only taken when the debug logs are off.
+        if (not retry_after
+                and 0 < limit_int <= 4 * remaining_int <= 3 * limit_int
+                and not logger.isEnabledFor(logging.DEBUG)):
+            if not reset:
+                return
+            reset_time = _parse_int(reset)
+            if reset_time is not None and reset_time > _time():
+                return
 
-            # Store original rate for recovery (if not already stored)
-            if not hasattr(limiter, '_original_rate'):
-                limiter._original_rate = limiter.rate
+        limiter = self.get_limiter(url)
 
-            # Adaptive rate adjustment based on remaining percentage
-            if remaining_pct < 0.05:  # Less than 5% remaining - EMERGENCY
-                new_rate = limiter.rate * 0.3
-                logger.warning(
-                    f"Rate limit CRITICAL for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}) - "
-                    f"Emergency slow down from {limiter.rate:.2f} to {new_rate:.2f} cps"
-                )
-                limiter.rate = max(0.1, new_rate)  # Don't go below 0.1 cps
+        # Calculate remaining percentage
+        remaining_pct = remaining_int / limit_int if limit_int > 0 else 1.0
 
-            elif remaining_pct < 0.1:  # Less than 10% remaining - AGGRESSIVE
-                new_rate = limiter.rate * 0.5
-                logger.warning(
-                    f"Rate limit LOW for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}) - "
-                    f"Aggressive slow down from {limiter.rate:.2f} to {new_rate:.2f} cps"
-                )
-                limiter.rate = max(0.5, new_rate)  # Don't go below 0.5 cps
+        # Adaptive rate adjustment based on remaining percentage
+        tier = bisect_right(self._TIER_THRESHOLDS, remaining_pct)
 
-            elif remaining_pct < 0.25:  # Less than 25% remaining - MODERATE
-                new_rate = limiter.rate * 0.75
-                logger.info(
-                    f"Rate limit depleting for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}) - "
-                    f"Moderate slow down from {limiter.rate:.2f} to {new_rate:.2f} cps"
+        if tier < len(self._SLOWDOWN_TIERS):
+            multiplier, min_rate, level, status, action = self._SLOWDOWN_TIERS[tier]
+            new_rate = limiter.rate * multiplier
+            if logger.isEnabledFor(level):
+                logger.log(
+                    level,
+                    f"Rate limit {status} for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}) - "
+                    f"{action} from {limiter.rate:.2f} to {new_rate:.2f} cps"
                 )
-                limiter.rate = max(1.0, new_rate)  # Don't go below 1.0 cps
+            limiter.rate = max(min_rate, new_rate)  # Don't go below the tier minimum
 
-            elif remaining_pct > 0.75:  # More than 75% remaining - CAN SPEED UP
-                original_rate = limiter._original_rate
-                if limiter.rate < original_rate:
-                    new_rate = min(original_rate, limiter.rate * 1.25)
+        elif remaining_pct > self._SPEEDUP_THRESHOLD:  # CAN SPEED UP
+            original_rate = limiter._original_rate
+            if limiter.rate < original_rate:
+                new_rate = min(original_rate, limiter.rate * 1.25)
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         f"Rate limit healthy for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}) - "
                         f"Speeding up from {limiter.rate:.2f} to {new_rate:.2f} cps"
                     )
-                    limiter.rate = new_rate
-                else:
-                    # Already at or above original rate - just log status
-                    logger.debug(
-                        f"Rate limit healthy for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}), "
-                        f"current rate: {limiter.rate:.2f} cps"
-                    )
-            else:
-                # Between 25% and 75% - stable zone, just log
+                limiter.rate = new_rate
+            elif logger.isEnabledFor(logging.DEBUG):
+                # Already at or above original rate - just log status
                 logger.debug(
-                    f"Rate limit stable for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}), "
+                    f"Rate limit healthy for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}), "
                     f"current rate: {limiter.rate:.2f} cps"
                 )
-
-            # Handle reset time
-            if reset:
-                try:
-                    reset_time = int(reset)
-                    time_until_reset = reset_time - time.time()
-                    if time_until_reset > 0:
-                        logger.debug(
-                            f"Rate limit for {url} resets in {time_until_reset:.0f}s "
-                            f"(at {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(reset_time))})"
-                        )
-                    else:
-                        # Reset time has passed - can recover to original rate
-                        if hasattr(limiter, '_original_rate') and limiter.rate < limiter._original_rate:
-                            logger.info(
-                                f"Rate limit window reset for {url} - "
-                                f"Recovering to original rate {limiter._original_rate:.2f} cps"
+        elif logger.isEnabledFor(logging.DEBUG):
+            # Between 25% and 75% - stable zone, just log
+            logger.debug(
+                f"Rate limit stable for {url}: {remaining}/{limit} remaining ({remaining_pct:.1%}), "
+                f"current rate: {limiter.rate:.2f} cps"
+            )
+
+        # Handle reset time
+        if reset:
+            reset_time = _parse_int(reset)
+            if reset_time is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Could not parse reset time '{reset}'")
+            else:
+                time_until_reset = reset_time - _time()
+                if time_until_reset > 0:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        try:
+                            logger.debug(
+                                f"Rate limit for {url} resets in {time_until_reset:.0f}s "
+                                f"(at {strftime('%Y-%m-%d %H:%M:%S UTC', gmtime(reset_time))})"
                             )
-                            limiter.rate = limiter._original_rate
-                except (ValueError, OSError) as e:
-                    logger.debug(f"Could not parse reset time '{reset}': {e}")
-
-            # Handle retry-after (typically from 429 responses)
-            if retry_after:
-                try:
-                    retry_seconds = int(retry_after)
-                    logger.warning(
-                        f"Retry-After header for {url}: wait {retry_seconds}s before next request"
+                        except (OverflowError, OSError) as e:
+                            logger.debug(f"Could not parse reset time '{reset}': {e}")
+                elif limiter.rate < limiter._original_rate:
+                    # Reset time has passed - can recover to original rate
+                    logger.info(
+                        f"Rate limit window reset for {url} - "
+                        f"Recovering to original rate {limiter._original_rate:.2f} cps"
                     )
-                    # Could implement actual waiting here or let caller handle it
-                except ValueError as e:
-                    logger.debug(f"Could not parse Retry-After '{retry_after}': {e}")
-
-        except ValueError as e:
-            logger.warning(f"Invalid rate limit headers for {url}: {e}")
\ No newline at end of file
+                    limiter.rate = limiter._original_rate
+
+        # Handle retry-after (typically from 429 responses)
+        if retry_after:
+            retry_seconds = _parse_int(retry_after)
+            if retry_seconds is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Could not parse Retry-After '{retry_after}'")
+            else:
+                logger.warning(
+                    f"Retry-After header for {url}: wait {retry_seconds}s before next request"
+                )
+                # Could implement actual waiting here or let caller handle it